@@ -7,6 +7,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+# Matches lines that start with optional whitespace and a '{', and end with a '}'
+JSON_LINE_RE = re.compile(r'\s*\{.*\}\s*$')
+
 # Read the Forge test output from stdin
 output = sys.stdin.read()
 
@@ -26,8 +29,7 @@ if logs_index is None:
 # Collect all JSON lines after 'Logs:'
 json_lines = []
 for line in lines[logs_index+1:]:
-    # Match lines that start with optional whitespace and a '{', and end with a '}'
-    if re.match(r'\s*\{.*\}\s*$', line):
+    if JSON_LINE_RE.match(line):
         json_lines.append(line.strip())
     else:
         # Stop collecting if the line doesn't match a JSON object